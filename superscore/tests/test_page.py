@@ -169,6 +169,54 @@ def test_apply_filter(test_client, search_page: SearchPage):
     assert search_page.results_table_view.model().rowCount() == 1
 
 
+@setup_test_stack(sources=["db/filestore.json"], backend_type=FilestoreBackend)
+def test_subfilter_results(qtbot: QtBot, test_client, search_page: SearchPage):
+    search_page.model.modelAboutToBeReset.emit()
+    search_page.model.entries = list(test_client.search())
+    search_page.model.modelReset.emit()
+    proxy_model = search_page.results_table_view.model()
+    n_entries = proxy_model.rowCount()
+    assert n_entries > 1
+
+    # keystrokes are coalesced, the filter is applied once typing pauses
+    search_page.name_subfilter_line_edit.setText('collection')
+    search_page.name_subfilter_line_edit.setText('collection 1')
+    assert search_page.subfilter_timer.isActive()
+    assert proxy_model.rowCount() == n_entries
+    qtbot.waitUntil(lambda: proxy_model.rowCount() == 1)
+
+
+@setup_test_stack(sources=["db/filestore.json"], backend_type=FilestoreBackend)
+def test_subfilter_unchanged_pattern(
+    qtbot: QtBot,
+    test_client,
+    search_page: SearchPage,
+):
+    search_page.model.modelAboutToBeReset.emit()
+    search_page.model.entries = list(test_client.search())
+    search_page.model.modelReset.emit()
+    proxy_model = search_page.proxy_model
+    line_edit = search_page.name_subfilter_line_edit
+    timer = search_page.subfilter_timer
+
+    line_edit.setText('collection 1')
+    qtbot.waitUntil(lambda: not timer.isActive())
+    assert proxy_model.rowCount() == 1
+
+    invalidate_calls = []
+    proxy_model.invalidateFilter = lambda: invalidate_calls.append(True)
+
+    # edited and reverted within one debounce interval, nothing to re-filter
+    line_edit.setText('collection 12')
+    line_edit.setText('collection 1')
+    qtbot.waitUntil(lambda: not timer.isActive())
+    assert invalidate_calls == []
+
+    line_edit.setText('')
+    qtbot.waitUntil(lambda: not timer.isActive())
+    assert invalidate_calls == [True]
+
+
 @setup_test_stack(sources=["db/filestore.json"], backend_type=FilestoreBackend)
 def test_coll_builder_add(test_client, collection_builder_page: CollectionBuilderPage):
     page = collection_builder_page
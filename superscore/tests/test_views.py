@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 import apischema
 import pytest
 from pytestqt.qtbot import QtBot
-from qtpy import QtCore, QtWidgets
+from qtpy import QtCore, QtGui, QtWidgets
 
 from superscore.backends.test import TestBackend
 from superscore.client import Client
@@ -14,10 +14,10 @@ from superscore.control_layers import EpicsData
 from superscore.model import (Collection, Nestable, Parameter, Root, Severity,
                               Status)
 from superscore.tests.conftest import nest_depth, setup_test_stack
-from superscore.widgets.views import (CustRoles, EntryItem, LivePVHeader,
-                                      LivePVTableModel, LivePVTableView,
-                                      NestableTableView, RootTree,
-                                      RootTreeView)
+from superscore.widgets.views import (ButtonDelegate, CustRoles, EntryItem,
+                                      LivePVHeader, LivePVTableModel,
+                                      LivePVTableView, NestableTableView,
+                                      RootTree, RootTreeView, _PVPollThread)
 
 
 @pytest.fixture(scope='function')
@@ -100,6 +100,74 @@ def test_pvmodel_update(pv_poll_model: LivePVTableModel, qtbot: QtBot):
     )
 
 
+def test_pv_view_pause_when_hidden(pv_table_view: LivePVTableView, qtbot: QtBot):
+    thread = pv_table_view.model()._poll_thread
+    cl_get = pv_table_view.client.cl.get
+    pv_table_view.show()
+    assert not thread.paused
+
+    pv_table_view.hide()
+    assert thread.paused
+    # let any in-flight poll finish, then check no further polls happen
+    qtbot.wait(int(thread.poll_period * 1000) + 200)
+    n_calls = cl_get.call_count
+    qtbot.wait(int(thread.poll_period * 1000) + 200)
+    assert cl_get.call_count == n_calls
+
+    pv_table_view.show()
+    assert not thread.paused
+    qtbot.wait_until(lambda: cl_get.call_count > n_calls, timeout=5000)
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
+def test_poll_thread_stop_before_run(test_client: Client, qtbot: QtBot):
+    test_client.cl.get = MagicMock(return_value=EpicsData(1))
+    thread = _PVPollThread(
+        client=test_client, data={'MY:PV': EpicsData(0)}, poll_period=1.0
+    )
+    thread.start()
+    # stop immediately, likely before run() has begun
+    thread.stop()
+
+    qtbot.wait_until(thread.isFinished, timeout=3000)
+    assert not thread.running
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
+def test_poll_thread_single_shot_paused(test_client: Client, qtbot: QtBot):
+    test_client.cl.get = MagicMock(return_value=EpicsData(1))
+    thread = _PVPollThread(
+        client=test_client, data={'MY:PV': EpicsData(0)}, poll_period=0
+    )
+    thread.paused = True
+    thread.start()
+
+    # a paused single-shot thread keeps waiting rather than finishing unpolled
+    qtbot.wait(300)
+    assert thread.isRunning()
+    test_client.cl.get.assert_not_called()
+
+    thread.paused = False
+    qtbot.wait_until(thread.isFinished)
+    test_client.cl.get.assert_called_once_with('MY:PV')
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
+def test_poll_thread_stop_while_paused(test_client: Client, qtbot: QtBot):
+    test_client.cl.get = MagicMock(return_value=EpicsData(1))
+    thread = _PVPollThread(
+        client=test_client, data={'MY:PV': EpicsData(0)}, poll_period=1.0
+    )
+    thread.paused = True
+    thread.start()
+    qtbot.wait_until(thread.isRunning)
+
+    # stopping wakes the paused thread
+    thread.stop()
+    assert thread.wait(1000)
+    test_client.cl.get.assert_not_called()
+
+
 @pytest.mark.parametrize("row,widget_cls,", [
     (0, QtWidgets.QDoubleSpinBox),
     (1, QtWidgets.QSpinBox),
@@ -280,6 +348,12 @@ def test_roottree_setup(sample_database: Root):
     assert tree_model.root_item.child(3).childCount() == 3
 
 
+def test_entry_item_slots(sample_database: Root):
+    tree_model = RootTree(base_entry=sample_database)
+    # items are slotted, no per-item __dict__
+    assert not hasattr(tree_model.root_item, '__dict__')
+
+
 @setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
 def test_root_tree_view_setup_init_args(test_client: Client):
     tree_view = RootTreeView(
@@ -290,6 +364,12 @@ def test_root_tree_view_setup_init_args(test_client: Client):
     assert isinstance(tree_view.model(), RootTree)
 
 
+def test_root_tree_view_uniform_rows(qtbot: QtBot):
+    tree_view = RootTreeView()
+    qtbot.addWidget(tree_view)
+    assert tree_view.uniformRowHeights()
+
+
 @setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
 def test_root_tree_view_setup_post_init(test_client: Client):
     tree_view = RootTreeView()
@@ -300,6 +380,34 @@ def test_root_tree_view_setup_post_init(test_client: Client):
     assert isinstance(tree_view.model(), RootTree)
 
 
+@setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
+def test_root_tree_view_context_menu(test_client: Client, qtbot: QtBot):
+    tree_view = RootTreeView(
+        client=test_client,
+        entry=test_client.backend.root
+    )
+    qtbot.addWidget(tree_view)
+    tree_view.resize(300, 600)
+    tree_view.show()
+    qtbot.waitExposed(tree_view)
+
+    requested = []
+
+    def create_context_menu(entry):
+        requested.append(entry)
+        return MagicMock()
+
+    tree_view.create_context_menu = create_context_menu
+
+    # clicks below the last row map to an invalid index
+    tree_view._tree_context_menu(QtCore.QPoint(5, 590))
+    assert requested == []
+
+    first_index = tree_view.model().index(0, 0)
+    tree_view._tree_context_menu(tree_view.visualRect(first_index).center())
+    assert requested == [first_index.internalPointer()._data]
+
+
 @setup_test_stack(sources=['db/filestore.json'], backend_type=TestBackend)
 def test_root_tree_fetchmore(test_client: Client):
     tree_view = RootTreeView()
@@ -333,3 +441,20 @@ def test_root_tree_fetchmore(test_client: Client):
     assert model.canFetchMore(child_index)
     model.fetchMore(child_index)
     assert not model.canFetchMore(child_index)
+
+
+def test_button_delegate_clicked(qtbot: QtBot):
+    model = QtGui.QStandardItemModel(3, 1)
+    view = QtWidgets.QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    delegate = ButtonDelegate(button_text='open')
+
+    index = model.index(1, 0)
+    button = delegate.createEditor(view, QtWidgets.QStyleOptionViewItem(), index)
+    # rows inserted above are tracked by the button's index
+    model.insertRow(0)
+    with qtbot.waitSignal(delegate.clicked) as blocker:
+        button.click()
+
+    assert blocker.args[0].row() == 2
@@ -5,7 +5,8 @@ from uuid import uuid4
 import pytest
 from pytestqt.qtbot import QtBot
 
-from superscore.model import Collection
+from superscore.model import Collection, Parameter, Root
+from superscore.widgets import ICON_MAP, ICON_SIZES, entry_name, get_icon
 from superscore.widgets.core import DataWidget
 
 
@@ -38,3 +39,17 @@ def test_collection_datawidget_bridge(
 
     qtbot.addWidget(widget1)
     qtbot.addWidget(widget2)
+
+
+def test_get_icon_cached(qtbot: QtBot):
+    icon = get_icon(ICON_MAP[Collection])
+    assert not icon.isNull()
+    assert len(icon.availableSizes()) == len(ICON_SIZES)
+    assert get_icon(ICON_MAP[Collection]) is icon
+
+
+def test_entry_name():
+    assert entry_name(Collection(title='my collection')) == 'my collection'
+    assert entry_name(Parameter(pv_name='MY:PV')) == 'MY:PV'
+    assert entry_name(Root()) == '<N/A>'
+    assert entry_name(Root(), default=None) is None
@@ -1,9 +1,11 @@
 from uuid import UUID
 
 from pytestqt.qtbot import QtBot
+from qtpy import QtCore
 
 from superscore.backends.filestore import FilestoreBackend
 from superscore.client import Client
+from superscore.model import Collection, Parameter, Snapshot
 from superscore.tests.conftest import setup_test_stack
 from superscore.widgets.window import Window
 
@@ -25,11 +27,86 @@ def test_main_window(qtbot: QtBot, test_client: Client):
     qtbot.addWidget(window)
 
 
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_collection_builder_tab_title(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    window.open_collection_builder()
+    page = window.tab_widget.widget(window.tab_widget.count() - 1)
+
+    page.bridge.title.put('my collection')
+    qtbot.waitUntil(
+        lambda: window.tab_widget.tabText(window.tab_widget.indexOf(page))
+        == 'my collection'
+    )
+
+    # closing a tab to the left shifts the page's index
+    window.remove_tab(0)
+    page.bridge.title.put('renamed collection')
+    qtbot.waitUntil(
+        lambda: window.tab_widget.tabText(window.tab_widget.indexOf(page))
+        == 'renamed collection'
+    )
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_remove_tab_releases_slot(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    window.open_collection_builder()
+    assert len(window._partial_slots) == 1
+
+    window.remove_tab(window.tab_widget.count() - 1)
+    assert len(window._partial_slots) == 0
+
+    # stale indices are ignored
+    window.remove_tab(window.tab_widget.count())
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_close_window_tabs(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    window.open_collection_builder()
+    window.open_collection_builder()
+    window.show()
+    qtbot.waitExposed(window)
+    pages = [window.tab_widget.widget(i) for i in range(window.tab_widget.count())]
+    assert len(pages) == 3
+    assert window.tab_widget.currentWidget().isVisible()
+
+    destroyed = []
+    for page in pages:
+        page.destroyed.connect(lambda *_, page_id=id(page): destroyed.append(page_id))
+
+    window.close()
+    assert window.tab_widget.count() == 0
+    # deletions posted from inside closeEvent are not run by nested event loops
+    # such as qtbot's, flush them as the application event loop would
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    assert sorted(destroyed) == sorted(id(page) for page in pages)
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_close_window_keeps_tab_bar_state(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    window.show()
+    tab_bar = window.tab_widget.tabBar()
+    tab_bar.hide()
+
+    window.close()
+    assert tab_bar.isHidden()
+
+
 @setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
 def test_sample_window(qtbot: QtBot, test_client: Client):
     window = Window(client=test_client)
     qtbot.addWidget(window)
 
+    # the tree model is installed once the event loop runs
+    assert window.tree_view.model() is None
+    qtbot.waitUntil(lambda: window.tree_view.model() is not None)
     assert count_visible_items(window.tree_view) == 4
 
     def get_last_index(index):
@@ -58,3 +135,32 @@ def test_sample_window(qtbot: QtBot, test_client: Client):
     while index.isValid():
         assert not isinstance(index.internalPointer()._data, UUID)
         index = window.tree_view.indexBelow(index)
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_context_menu_reused(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    snapshot = next(test_client.search(('entry_type', 'eq', Snapshot)))
+    collection = next(test_client.search(('entry_type', 'eq', Collection)))
+
+    menu = window._window_context_menu(collection)
+    assert not window._restore_action.isVisible()
+    assert window._window_context_menu(snapshot) is menu
+    assert window._restore_action.isVisible()
+
+    opened = []
+    window.open_restore_page = opened.append
+    window._restore_action.trigger()
+    assert opened == [snapshot]
+
+
+@setup_test_stack(sources=['db/filestore.json'], backend_type=FilestoreBackend)
+def test_open_page_tab_name(qtbot: QtBot, test_client: Client):
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    parameter = next(test_client.search(('entry_type', 'eq', Parameter)))
+
+    page = window.open_page(parameter)
+    assert window.tab_widget.currentWidget() is page
+    assert window.tab_widget.tabText(window.tab_widget.currentIndex()) == parameter.pv_name
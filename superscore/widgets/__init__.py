@@ -1,3 +1,7 @@
+from functools import lru_cache
+from typing import Optional
+
+
 def _get_icon_map():
     # do not pollute namespace
     from superscore.model import (Collection, Parameter, Readback, Setpoint,
@@ -17,6 +21,61 @@ def _get_icon_map():
 
 ICON_MAP = _get_icon_map()
 
+# sizes to pre-render qtawesome icons at, covering tab, tree, and button icons
+ICON_SIZES = (16, 24, 32)
+
+
+@lru_cache(maxsize=64)
+def get_icon(name: str):
+    """
+    Return a QIcon for the qtawesome icon ``name``, built from pixmaps rendered
+    once at each of ``ICON_SIZES``.  qtawesome icons re-render their font glyph
+    on every paint, while pixmap-backed icons are simply blitted.  Results are
+    cached, so repeated requests for the same icon are a dictionary lookup.
+
+    Requires a QApplication to exist.
+    """
+    # do not pollute namespace
+    import qtawesome as qta
+    from qtpy import QtGui
+
+    qta_icon = qta.icon(name)
+    icon = QtGui.QIcon()
+    for size in ICON_SIZES:
+        icon.addPixmap(qta_icon.pixmap(size, size))
+    return icon
+
+
+def _get_name_attr_map():
+    # do not pollute namespace
+    from superscore.model import (Collection, Parameter, Readback, Setpoint,
+                                  Snapshot)
+
+    # attribute holding the displayed name of each entry type
+    name_attr_map = {
+        Collection: 'title',
+        Parameter: 'pv_name',
+        Snapshot: 'title',
+        Setpoint: 'pv_name',
+        Readback: 'pv_name',
+    }
+
+    return name_attr_map
+
+
+NAME_ATTR_MAP = _get_name_attr_map()
+
+
+def entry_name(entry, default: Optional[str] = '<N/A>') -> Optional[str]:
+    """
+    Return the name displayed for ``entry``, its title or PV name, or
+    ``default`` if its type has no name attribute.
+    """
+    name_attr = NAME_ATTR_MAP.get(type(entry))
+    if name_attr is None:
+        return default
+    return getattr(entry, name_attr, default)
+
 
 def get_window():
     """
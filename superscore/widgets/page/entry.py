@@ -5,7 +5,6 @@ import logging
 from copy import deepcopy
 from typing import Optional, Union
 
-import qtawesome as qta
 from qtpy import QtWidgets
 from qtpy.QtGui import QCloseEvent
 
@@ -13,6 +12,7 @@ from superscore.control_layers._base_shim import EpicsData
 from superscore.model import (Collection, Nestable, Parameter, Readback,
                               Setpoint, Severity, Snapshot, Status)
 from superscore.type_hints import AnyEpicsType
+from superscore.widgets import get_icon
 from superscore.widgets.core import (DataWidget, Display, NameDescTagsWidget,
                                      WindowLinker)
 from superscore.widgets.manip_helpers import (insert_widget,
@@ -178,7 +178,7 @@ class BaseParameterPage(Display, DataWidget, WindowLinker):
         self._edata_thread.finished.connect(self.update_live_value)
 
         self.refresh_button.setToolTip('refresh edit details')
-        self.refresh_button.setIcon(qta.icon('ei.refresh'))
+        self.refresh_button.setIcon(get_icon('ei.refresh'))
         self.refresh_button.clicked.connect(self.get_edata)
         self.get_edata()
 
@@ -270,7 +270,7 @@ class BaseParameterPage(Display, DataWidget, WindowLinker):
         data = self.edata
         if not isinstance(data, EpicsData):
             new_widget = QtWidgets.QToolButton()
-            new_widget.setIcon(qta.icon("msc.debug-disconnect"))
+            new_widget.setIcon(get_icon("msc.debug-disconnect"))
             new_widget.setEnabled(False)
             new_widget.setSizePolicy(
                 QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
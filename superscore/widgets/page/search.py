@@ -4,14 +4,13 @@ import logging
 from enum import auto
 from typing import Any, Dict, List, Optional
 
-import qtawesome as qta
 from dateutil import tz
 from qtpy import QtCore, QtWidgets
 
 from superscore.backends.core import SearchTerm
 from superscore.model import Collection, Entry, Readback, Setpoint, Snapshot
 from superscore.type_hints import OpenPageSlot
-from superscore.widgets import ICON_MAP, get_window
+from superscore.widgets import ICON_MAP, entry_name, get_icon, get_window
 from superscore.widgets.core import Display, WindowLinker
 from superscore.widgets.views import (BaseTableEntryModel, ButtonDelegate,
                                       HeaderEnum)
@@ -52,6 +51,9 @@ class SearchPage(Display, QtWidgets.QWidget, WindowLinker):
     filter_table_view: QtWidgets.QTableView
     results_table_view: QtWidgets.QTableView
 
+    # delay between the last subfilter keystroke and re-filtering the table
+    subfilter_delay_ms: int = 150
+
     def __init__(
         self,
         *args,
@@ -74,10 +76,10 @@ class SearchPage(Display, QtWidgets.QWidget, WindowLinker):
         self.end_dt_edit.setDisplayFormat("yyyy/MM/dd")
         self.apply_filter_button.clicked.connect(self.show_current_filter)
 
-        self.collection_checkbox.setIcon(qta.icon(ICON_MAP[Collection]))
-        self.snapshot_checkbox.setIcon(qta.icon(ICON_MAP[Snapshot]))
-        self.setpoint_checkbox.setIcon(qta.icon(ICON_MAP[Setpoint]))
-        self.readback_checkbox.setIcon(qta.icon(ICON_MAP[Readback]))
+        self.collection_checkbox.setIcon(get_icon(ICON_MAP[Collection]))
+        self.snapshot_checkbox.setIcon(get_icon(ICON_MAP[Snapshot]))
+        self.setpoint_checkbox.setIcon(get_icon(ICON_MAP[Setpoint]))
+        self.readback_checkbox.setIcon(get_icon(ICON_MAP[Readback]))
 
         # set up filter table view
         self.model = ResultModel(entries=[])
@@ -93,7 +95,12 @@ class SearchPage(Display, QtWidgets.QWidget, WindowLinker):
                                                          self.open_delegate)
         self.open_delegate.clicked.connect(self.proxy_model.open_row)
 
-        self.name_subfilter_line_edit.textChanged.connect(self.subfilter_results)
+        # coalesce bursts of keystrokes into a single filter pass
+        self.subfilter_timer = QtCore.QTimer(self)
+        self.subfilter_timer.setSingleShot(True)
+        self.subfilter_timer.setInterval(self.subfilter_delay_ms)
+        self.subfilter_timer.timeout.connect(self.subfilter_results)
+        self.name_subfilter_line_edit.textChanged.connect(self.queue_subfilter)
 
     def _gather_search_terms(self) -> Dict[str, Any]:
         search_terms = []
@@ -150,9 +157,17 @@ class SearchPage(Display, QtWidgets.QWidget, WindowLinker):
         self.model.entries = list(entries)
         self.model.modelReset.emit()
 
+    def queue_subfilter(self) -> None:
+        """(Re)start the subfilter timer, filtering once typing pauses"""
+        self.subfilter_timer.start()
+
     def subfilter_results(self) -> None:
         """Filter the table once more by name"""
-        self.proxy_model.name_regexp.setPattern(self.name_subfilter_line_edit.text())
+        pattern = self.name_subfilter_line_edit.text()
+        # eg. text edited and reverted within one debounce interval
+        if pattern == self.proxy_model.name_regexp.pattern():
+            return
+        self.proxy_model.name_regexp.setPattern(pattern)
         self.proxy_model.invalidateFilter()
 
 
@@ -205,8 +220,7 @@ class ResultModel(BaseTableEntryModel):
             return QtCore.QVariant()
 
         if index.column() == 0:  # name column
-            name_text = getattr(entry, 'title', getattr(entry, 'pv_name', '<N/A>'))
-            return name_text
+            return entry_name(entry)
         elif index.column() == 1:  # Type
             return type(entry).__name__
         elif index.column() == 2:  # Description
@@ -246,13 +260,12 @@ class ResultFilterProxyModel(QtCore.QSortFilterProxyModel):
         source_row: int,
         source_parent: QtCore.QModelIndex
     ) -> bool:
-        name_ok = True
-
-        name_index = self.sourceModel().index(source_row, 0, source_parent)
-        name = self.sourceModel().data(name_index, QtCore.Qt.DisplayRole)
-        name_ok = self.name_regexp.match(name).hasMatch()
-
-        return name_ok
+        # an empty pattern matches every name, skip the regex entirely
+        if not self.name_regexp.pattern():
+            return True
+        # read the entry directly rather than round-tripping through data()
+        entry = self.sourceModel().entries[source_row]
+        return self.name_regexp.match(entry_name(entry)).hasMatch()
 
     def open_row(self, proxy_index: QtCore.QModelIndex) -> None:
         """opens page for entry data at ``row`` (in proxy model)"""
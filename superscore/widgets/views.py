@@ -5,6 +5,7 @@ Qt tree model and item classes for visualizing Entry dataclasses
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from enum import Enum, IntEnum, auto
 from functools import partial
@@ -14,7 +15,6 @@ from uuid import UUID
 from weakref import WeakValueDictionary
 
 import numpy as np
-import qtawesome as qta
 from qtpy import QtCore, QtGui, QtWidgets
 
 from superscore.backends.core import SearchTerm
@@ -24,7 +24,7 @@ from superscore.errors import EntryNotFoundError
 from superscore.model import (Collection, Entry, Nestable, Parameter, Readback,
                               Root, Setpoint, Severity, Snapshot, Status)
 from superscore.qt_helpers import QDataclassBridge
-from superscore.widgets import ICON_MAP, get_window
+from superscore.widgets import ICON_MAP, get_icon, get_window
 from superscore.widgets.core import QtSingleton, WindowLinker
 
 logger = logging.getLogger(__name__)
@@ -129,6 +129,9 @@ class CustRoles(IntEnum):
 
 class EntryItem:
     """Node representing one Entry"""
+    # trees may hold many items, avoid a per-instance __dict__
+    __slots__ = ('_data', '_parent', '_columncount', '_children', '_row', 'bridge')
+
     _bridge_cache: ClassVar[
         WeakValueDictionary[int, QDataclassBridge]
     ] = WeakValueDictionary()
@@ -323,7 +326,7 @@ class EntryItem:
         icon_id = ICON_MAP.get(type(self._data), None)
         if icon_id is None:
             return
-        return qta.icon(icon_id)
+        return get_icon(icon_id)
 
 
 def build_tree(
@@ -639,6 +642,8 @@ class RootTreeView(QtWidgets.QTreeView, WindowLinker):
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._tree_context_menu)
         self.setExpandsOnDoubleClick(False)
+        # every row is one line of text and an icon, skip per-row height queries
+        self.setUniformRowHeights(True)
         self.doubleClicked.connect(self.open_index)
 
     @WindowLinker.client.setter
@@ -681,11 +686,16 @@ class RootTreeView(QtWidgets.QTreeView, WindowLinker):
 
     def _tree_context_menu(self, pos: QtCore.QPoint) -> None:
         index: QtCore.QModelIndex = self.indexAt(pos)
-        if index is not None and index.data() is not None:
-            entry: Entry = index.internalPointer()._data
-            menu = self.create_context_menu(entry)
+        # indexAt returns an invalid index for clicks on empty space
+        if not index.isValid():
+            return
 
-            menu.exec_(self.mapToGlobal(pos))
+        item = index.internalPointer()
+        if item is None or index.data() is None:
+            return
+
+        menu = self.create_context_menu(item._data)
+        menu.exec_(self.mapToGlobal(pos))
 
     def create_context_menu(self, entry: Entry) -> QtWidgets.QMenu:
         """
@@ -871,7 +881,7 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
         icon_id = ICON_MAP.get(type(entry), None)
         if icon_id is None:
             return
-        return qta.icon(icon_id)
+        return get_icon(icon_id)
 
 
 class DisplayType(Enum):
@@ -930,6 +940,7 @@ class LivePVTableModel(BaseTableEntryModel):
         self.poll_period = poll_period
         self._data_cache = {e.pv_name: None for e in entries}
         self._poll_thread = None
+        self._polling_paused = False
 
         self.start_polling()
 
@@ -944,6 +955,7 @@ class LivePVTableModel(BaseTableEntryModel):
             client=self.client,
             parent=self
         )
+        self._poll_thread.paused = self._polling_paused
         self._data_cache = self._poll_thread.data
         self._poll_thread.data_ready.connect(self._data_ready)
         self._poll_thread.finished.connect(self._poll_thread_finished)
@@ -965,6 +977,21 @@ class LivePVTableModel(BaseTableEntryModel):
             self._poll_thread.wait(wait_time)
         self._poll_thread.data = {}
 
+    def pause_polling(self) -> None:
+        """
+        Pause polling without stopping the polling thread, e.g. while the data
+        is not visible.  Cached data is kept and served as-is.
+        """
+        self._polling_paused = True
+        if self._poll_thread is not None:
+            self._poll_thread.paused = True
+
+    def resume_polling(self) -> None:
+        """Resume polling after a call to ``pause_polling``"""
+        self._polling_paused = False
+        if self._poll_thread is not None:
+            self._poll_thread.paused = False
+
     @QtCore.Slot()
     def _poll_thread_finished(self):
         """Slot: poll thread finished and returned."""
@@ -1070,12 +1097,15 @@ class LivePVTableModel(BaseTableEntryModel):
         Any
             the requested data
         """
-        entry: PVEntry = self.entries[index.row()]
+        # called for every role of every visible cell, query the index once
+        row = index.row()
+        column = index.column()
+        entry: PVEntry = self.entries[row]
         if isinstance(entry, UUID):
-            entry = self.client.backend.get_entry(self.entries[index.row()])
-            self.entries[index.row()] = entry
+            entry = self.client.backend.get_entry(entry)
+            self.entries[row] = entry
 
-        if index.column() == LivePVHeader.PV_NAME:
+        if column == LivePVHeader.PV_NAME:
             if role == QtCore.Qt.DecorationRole:
                 return self.icon(entry)
             elif role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
@@ -1090,7 +1120,7 @@ class LivePVTableModel(BaseTableEntryModel):
             # Other parts of the table are read only
             return QtCore.QVariant()
 
-        if index.column() == LivePVHeader.STORED_VALUE:
+        if column == LivePVHeader.STORED_VALUE:
             if role == CustRoles.DisplayTypeRole:
                 return DisplayType.EPICS_DATA
             cache_data = self.get_cache_data(entry.pv_name)
@@ -1105,7 +1135,7 @@ class LivePVTableModel(BaseTableEntryModel):
                 if cache_data.enums and isinstance(stored_data, int):
                     return cache_data.enums[stored_data]
             return stored_data
-        elif index.column() == LivePVHeader.LIVE_VALUE:
+        elif column == LivePVHeader.LIVE_VALUE:
             live_value = self._get_live_data_field(entry, 'data')
             if role == QtCore.Qt.BackgroundRole:
                 stored_data = getattr(entry, 'data', None)
@@ -1113,25 +1143,25 @@ class LivePVTableModel(BaseTableEntryModel):
                 if stored_data is not None and not is_close:
                     return QtGui.QColor('red')
             return str(live_value)
-        elif index.column() == LivePVHeader.TIMESTAMP:
+        elif column == LivePVHeader.TIMESTAMP:
             return entry.creation_time.strftime('%Y/%m/%d %H:%M')
-        elif index.column() == LivePVHeader.STORED_STATUS:
+        elif column == LivePVHeader.STORED_STATUS:
             if role == CustRoles.DisplayTypeRole:
                 return DisplayType.STATUS
             status = getattr(entry, 'status', '--')
             return getattr(status, 'name', status)
-        elif index.column() == LivePVHeader.LIVE_STATUS:
+        elif column == LivePVHeader.LIVE_STATUS:
             return self._get_live_data_field(entry, 'status')
-        elif index.column() == LivePVHeader.STORED_SEVERITY:
+        elif column == LivePVHeader.STORED_SEVERITY:
             if role == CustRoles.DisplayTypeRole:
                 return DisplayType.SEVERITY
             severity = getattr(entry, 'severity', '--')
             return getattr(severity, 'name', severity)
-        elif index.column() == LivePVHeader.LIVE_SEVERITY:
+        elif column == LivePVHeader.LIVE_SEVERITY:
             return self._get_live_data_field(entry, 'severity')
-        elif index.column() == LivePVHeader.OPEN:
+        elif column == LivePVHeader.OPEN:
             return "Open"
-        elif index.column() == LivePVHeader.REMOVE:
+        elif column == LivePVHeader.REMOVE:
             return "Remove"
 
         # if nothing is found, return invalid QVariant
@@ -1247,11 +1277,34 @@ class _PVPollThread(QtCore.QThread):
         self.poll_period = poll_period
         self.client = client
         self.running = False
+        self._paused = False
+        # set to wake a paused thread, on resume or stop
+        self._wake = threading.Event()
         self._attrs = set()
 
+    def start(self, *args, **kwargs) -> None:
+        """
+        Start the polling thread.  Marks the thread as running before it starts,
+        so a stop() requested before run() begins is not overwritten.
+        """
+        self.running = True
+        super().start(*args, **kwargs)
+
     def stop(self) -> None:
         """Stop the polling thread."""
         self.running = False
+        self._wake.set()
+
+    @property
+    def paused(self) -> bool:
+        """Whether polling is paused.  A paused thread blocks until resumed"""
+        return self._paused
+
+    @paused.setter
+    def paused(self, paused: bool) -> None:
+        self._paused = paused
+        if not paused:
+            self._wake.set()
 
     def _update_data(self, pv_name):
         """
@@ -1271,11 +1324,16 @@ class _PVPollThread(QtCore.QThread):
 
     def run(self):
         """The thread polling loop."""
-        self.running = True
-
         self.data_ready.emit()
 
         while self.running:
+            if self.paused:
+                # block until resumed or stopped, without spending a
+                # single-shot update
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
             t0 = time.monotonic()
             for pv_name in self.data:
                 self._update_data(pv_name)
@@ -1523,6 +1581,17 @@ class LivePVTableView(BaseDataTableView):
             self._model.client = self._client
             self._model.start_polling()
 
+    def showEvent(self, a0: QtGui.QShowEvent) -> None:
+        if self._model is not None:
+            self._model.resume_polling()
+        super().showEvent(a0)
+
+    def hideEvent(self, a0: QtGui.QHideEvent) -> None:
+        # e.g. a background tab or minimized window, no need to poll
+        if self._model is not None:
+            self._model.pause_polling()
+        super().hideEvent(a0)
+
     def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
         logger.debug("Stopping pv_model polling")
         self._model.stop_polling(wait_time=5000)
@@ -1638,11 +1707,16 @@ class ButtonDelegate(QtWidgets.QStyledItemDelegate):
         index: QtCore.QModelIndex
     ) -> QtWidgets.QWidget:
         button = QtWidgets.QPushButton(self.button_text, parent)
-        button.clicked.connect(
-            lambda _, index=index: self.clicked.emit(index)
-        )
+        # the index travels with the button, so every editor shares one slot
+        button.setProperty('index', QtCore.QPersistentModelIndex(index))
+        button.clicked.connect(self._button_clicked)
         return button
 
+    def _button_clicked(self) -> None:
+        """Slot: re-emit an editor button's click with its model index"""
+        index = self.sender().property('index')
+        self.clicked.emit(QtCore.QModelIndex(index))
+
     def updateEditorGeometry(
         self,
         editor: QtWidgets.QWidget,
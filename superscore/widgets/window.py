@@ -4,17 +4,15 @@ Top-level window widget that contains other widgets
 from __future__ import annotations
 
 import logging
-from functools import partial
 from typing import Optional
 
-import qtawesome as qta
 from pcdsutils.qt.callbacks import WeakPartialMethodSlot
 from qtpy import QtCore, QtWidgets
 from qtpy.QtGui import QCloseEvent
 
 from superscore.client import Client
 from superscore.model import Entry, Snapshot
-from superscore.widgets import ICON_MAP
+from superscore.widgets import ICON_MAP, entry_name, get_icon
 from superscore.widgets.core import DataWidget, Display, QtSingleton
 from superscore.widgets.page import PAGE_MAP
 from superscore.widgets.page.collection_builder import CollectionBuilderPage
@@ -25,6 +23,11 @@ from superscore.widgets.views import DiffDispatcher, RootTreeView
 
 logger = logging.getLogger(__name__)
 
+# page class and tab icon name for each openable entry type
+_PAGE_DISPATCH = {
+    entry_type: (page, ICON_MAP[entry_type]) for entry_type, page in PAGE_MAP.items()
+}
+
 
 class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
     """Main superscore window"""
@@ -46,7 +49,8 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         else:
             self.client = Client.from_config()
 
-        self._partial_slots = []
+        # title update slots for open tabs, keyed by id(page)
+        self._partial_slots: dict[int, WeakPartialMethodSlot] = {}
 
         self.setup_ui()
         self.open_search_page()
@@ -58,10 +62,15 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         tab_bar.setElideMode(QtCore.Qt.ElideNone)
         self.tab_widget.tabCloseRequested.connect(self.remove_tab)
 
-        # setup tree view
+        # setup tree view.  Filling the tree walks the backend, defer it until
+        # the event loop runs so construction does not wait on it
         self.tree_view.client = self.client
-        self.tree_view.set_data(self.client.backend.root)
+        self.tree_timer = QtCore.QTimer(self)
+        self.tree_timer.setSingleShot(True)
+        self.tree_timer.timeout.connect(self.install_tree_model)
+        self.tree_timer.start(0)
         # override context menu
+        self.setup_context_menu()
         self.tree_view.create_context_menu = self._window_context_menu
 
         # setup actions
@@ -70,17 +79,46 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         # open diff page
         self.diff_dispatcher.comparison_ready.connect(self.open_diff_page)
 
+    def install_tree_model(self) -> None:
+        """Build the tree model from the client's backend root"""
+        self.tree_view.set_data(self.client.backend.root)
+
+    def setup_context_menu(self) -> None:
+        """
+        Build the tree context menu once.  The actions act on
+        ``self._context_entry``, which is set each time the menu is requested
+        """
+        self._context_entry: Optional[Entry] = None
+        self._context_menu = QtWidgets.QMenu(self)
+        self._open_action = self._context_menu.addAction('')
+        self._open_action.triggered.connect(self._open_context_entry)
+        self._restore_action = self._context_menu.addAction('Inspect values')
+        self._restore_action.triggered.connect(self._restore_context_entry)
+
     def remove_tab(self, tab_index: int) -> None:
         """Remove the requested tab and delete the widget"""
-        widget = self.tab_widget.widget(tab_index)
+        tab_widget = self.tab_widget
+        widget = tab_widget.widget(tab_index)
+        if widget is None:
+            # already removed, eg. a repeated close request for the same tab
+            return
+        self._partial_slots.pop(id(widget), None)
         widget.close()
         widget.deleteLater()
-        self.tab_widget.removeTab(tab_index)
+        tab_widget.removeTab(tab_index)
+
+    def _update_tab_title(self, page: QtWidgets.QWidget) -> None:
+        """Update the tab title for ``page``.  Assumes page._title exists"""
+        # look up the index now, tabs to the left may have closed since opening
+        tab_widget = self.tab_widget
+        tab_index = tab_widget.indexOf(page)
+        if tab_index < 0:
+            return
 
-    def _update_tab_title(self, tab_index: int) -> None:
-        """Update a DataWidget tab title.  Assumes widget.title exists"""
-        title_text = self.tab_widget.widget(tab_index)._title
-        self.tab_widget.setTabText(tab_index, title_text)
+        title_text = page._title
+        # setTabText re-lays out the whole tab bar, skip it if nothing changed
+        if tab_widget.tabText(tab_index) != title_text:
+            tab_widget.setTabText(tab_index, title_text)
 
     def open_collection_builder(self):
         """open collection builder page"""
@@ -90,9 +128,9 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         update_slot = WeakPartialMethodSlot(
             page.bridge.title, page.bridge.title.updated,
             self._update_tab_title,
-            tab_index=self.tab_widget.indexOf(page),
+            page=page,
         )
-        self._partial_slots.append(update_slot)
+        self._partial_slots[id(page)] = update_slot
 
     def open_page(self, entry: Entry) -> DataWidget:
         """
@@ -108,27 +146,27 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         DataWidget
             Created widget, for cross references
         """
-        logger.debug(f'attempting to open {entry}')
+        logger.debug('attempting to open %s', entry)
         if not isinstance(entry, Entry):
             logger.debug('Could not open page for non-Entry dataclass')
             return
 
-        if type(entry) not in PAGE_MAP:
-            logger.debug(f'No page corresponding to {type(entry).__name__}')
-
-        try:
-            page = PAGE_MAP[type(entry)]
-        except KeyError:
-            logger.debug(f'No page widget for {type(entry)}, cannot open in tab')
+        entry_type = type(entry)
+        dispatch = _PAGE_DISPATCH.get(entry_type)
+        if dispatch is None:
+            logger.debug(
+                'No page widget for %s, cannot open in tab', entry_type.__name__
+            )
             return
 
+        page, icon_name = dispatch
         page_widget = page(data=entry, client=self.client)
-        icon = qta.icon(ICON_MAP[type(entry)])
-        tab_name = getattr(
-            entry, 'title', getattr(entry, 'pv_name', f'<{type(entry).__name__}>')
-        )
-        idx = self.tab_widget.addTab(page_widget, icon, tab_name)
-        self.tab_widget.setCurrentIndex(idx)
+        tab_name = entry_name(entry, default=None)
+        if tab_name is None:
+            tab_name = f'<{entry_type.__name__}>'
+        tab_widget = self.tab_widget
+        idx = tab_widget.addTab(page_widget, get_icon(icon_name), tab_name)
+        tab_widget.setCurrentIndex(idx)
 
         return page_widget
 
@@ -147,29 +185,49 @@ class Window(Display, QtWidgets.QMainWindow, metaclass=QtSingleton):
         self.tab_widget.setCurrentIndex(index)
 
     def open_diff_page(self) -> None:
+        dispatcher = self.diff_dispatcher
         page = DiffPage(
             client=self.client,
-            l_entry=self.diff_dispatcher.l_entry,
-            r_entry=self.diff_dispatcher.r_entry,
+            l_entry=dispatcher.l_entry,
+            r_entry=dispatcher.r_entry,
         )
         index = self.tab_widget.addTab(page, 'Comparison View')
         self.tab_widget.setCurrentIndex(index)
 
     def _window_context_menu(self, entry: Entry) -> QtWidgets.QMenu:
-        """override for RootTreeView context menu"""
-        menu = QtWidgets.QMenu(self)
-        open_action = menu.addAction(
-            f'&Open Detailed {type(entry).__name__} page'
-        )
-        # WeakPartialMethodSlot may not be needed, menus are transient
-        open_action.triggered.connect(partial(self.open_page, entry))
-        if isinstance(entry, Snapshot):
-            restore_page_action = menu.addAction('Inspect values')
-            restore_page_action.triggered.connect(partial(self.open_restore_page, entry))
+        """override for RootTreeView context menu, re-targets the shared menu"""
+        self._context_entry = entry
+        self._open_action.setText(f'&Open Detailed {type(entry).__name__} page')
+        self._restore_action.setVisible(isinstance(entry, Snapshot))
+        return self._context_menu
+
+    def _open_context_entry(self) -> None:
+        if self._context_entry is not None:
+            self.open_page(self._context_entry)
 
-        return menu
+    def _restore_context_entry(self) -> None:
+        if isinstance(self._context_entry, Snapshot):
+            self.open_restore_page(self._context_entry)
 
     def closeEvent(self, a0: QCloseEvent) -> None:
-        while self.tab_widget.count() > 0:
-            self.remove_tab(0)
+        # tear down every tab in one pass, rather than re-laying out the tab bar
+        # and emitting currentChanged for each removed tab.  A hidden tab bar
+        # defers its tab layout until it is shown again
+        tab_widget = self.tab_widget
+        tab_bar = tab_widget.tabBar()
+        tab_bar_hidden = tab_bar.isHidden()
+        tab_bar.setVisible(False)
+        tab_widget.setUpdatesEnabled(False)
+        tab_widget.blockSignals(True)
+        try:
+            for tab_index in range(tab_widget.count() - 1, -1, -1):
+                widget = tab_widget.widget(tab_index)
+                widget.close()
+                widget.deleteLater()
+            tab_widget.clear()
+            self._partial_slots.clear()
+        finally:
+            tab_widget.blockSignals(False)
+            tab_widget.setUpdatesEnabled(True)
+            tab_bar.setVisible(not tab_bar_hidden)
         super().closeEvent(a0)